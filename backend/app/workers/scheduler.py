@@ -2,14 +2,27 @@
 
 from __future__ import annotations
 
-from collections.abc import Awaitable, Callable
+from collections.abc import Awaitable, Callable, Mapping
+from types import MappingProxyType
+from typing import Final
 
+from apscheduler.job import Job
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 
 from ..core.settings import Settings, get_settings
 
 JobHandler = Callable[[], Awaitable[None] | None]
 
+# Only misfire_grace_time departs from APScheduler's defaults (1s); coalesce and
+# max_instances pin the library defaults so they do not drift on upgrade.
+JOB_DEFAULTS: Final[Mapping[str, int | bool]] = MappingProxyType(
+    {
+        "coalesce": True,
+        "max_instances": 1,
+        "misfire_grace_time": 300,
+    }
+)
+
 
 class SchedulerService:
     """Wrapper around APScheduler to manage recurring jobs."""
@@ -21,7 +34,9 @@ class SchedulerService:
             settings: Application settings containing scheduler configuration.
         """
 
-        self._scheduler = AsyncIOScheduler(timezone=settings.scheduler_timezone)
+        self._scheduler = AsyncIOScheduler(
+            timezone=settings.scheduler_timezone, job_defaults=JOB_DEFAULTS
+        )
 
     def add_daily_job(self, func: JobHandler, *, hour: int = 3) -> None:
         """Register a daily job at the specified hour.
@@ -33,6 +48,18 @@ class SchedulerService:
 
         self._scheduler.add_job(func, "cron", hour=hour, id=f"daily-{func.__name__}")
 
+    def get_job(self, job_id: str) -> Job | None:
+        """Look up a scheduled job by identifier.
+
+        Args:
+            job_id: Identifier of the job, e.g. ``daily-<function name>``.
+
+        Returns:
+            Job | None: The scheduled job, or ``None`` if no such job exists.
+        """
+
+        return self._scheduler.get_job(job_id)
+
     def start(self) -> None:
         """Start the underlying scheduler."""
 
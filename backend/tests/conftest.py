@@ -0,0 +1,28 @@
+"""Shared pytest fixtures for the Paper Scope backend."""
+
+from __future__ import annotations
+
+import sys
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.append(str(PROJECT_ROOT))
+
+from backend.app.main import app  # noqa: E402  pylint: disable=wrong-import-position
+
+
+@pytest.fixture(scope="session")
+def client() -> Iterator[TestClient]:
+    """Provide a test client whose app lifespan runs once per session.
+
+    Yields:
+        TestClient: Client bound to the started FastAPI application.
+    """
+
+    with TestClient(app) as test_client:
+        yield test_client
@@ -0,0 +1,34 @@
+"""Tests for the scheduler service."""
+
+from __future__ import annotations
+
+import pytest
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
+
+from backend.app.core.settings import Settings
+from backend.app.workers.scheduler import create_scheduler_service
+
+
+def _noop() -> None:
+    """Placeholder job used for scheduling assertions."""
+
+
+@pytest.mark.asyncio
+async def test_daily_job_tolerates_late_fires() -> None:
+    """Ensure daily jobs get a wider misfire grace window than APScheduler's."""
+
+    baseline = AsyncIOScheduler()
+    baseline.add_job(_noop, "cron", hour=3, id="baseline")
+    baseline.start()
+    baseline_grace = baseline.get_job("baseline").misfire_grace_time
+    baseline.shutdown(wait=False)
+
+    service = create_scheduler_service(settings=Settings())
+    service.add_daily_job(_noop)
+    service.start()
+    job = service.get_job("daily-_noop")
+    service.shutdown()
+
+    assert job is not None
+    assert job.misfire_grace_time == 300
+    assert job.misfire_grace_time != baseline_grace